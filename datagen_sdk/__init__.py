@@ -5,9 +5,11 @@ from .client import (
     DatagenToolError,
     DatagenHttpError,
 )
+from .async_client import AsyncDatagenClient
 
 __all__ = [
     "DatagenClient",
+    "AsyncDatagenClient",
     "DatagenError",
     "DatagenAuthError",
     "DatagenToolError",
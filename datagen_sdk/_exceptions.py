@@ -0,0 +1,24 @@
+"""Exception hierarchy shared by both clients."""
+
+from typing import Optional
+
+
+class DatagenError(Exception):
+    """Base Datagen SDK exception."""
+
+
+class DatagenAuthError(DatagenError):
+    """Authentication or API-key related errors."""
+
+
+class DatagenToolError(DatagenError):
+    """Returned when a tool executes but signals failure."""
+
+
+class DatagenHttpError(DatagenError):
+    """HTTP-level errors (network/4xx/5xx)."""
+
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
@@ -0,0 +1,96 @@
+"""Response handling shared by `DatagenClient` and `AsyncDatagenClient`.
+
+Retry/backoff policy, `Retry-After` parsing and envelope validation live here so both
+transports apply the same rules.
+"""
+
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+from ._exceptions import DatagenHttpError, DatagenToolError
+
+MAX_BACKOFF_SECONDS = 30.0
+
+# Statuses worth retrying; anything else (400, 404, 409, ...) fails on the first attempt.
+_RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class _BackoffPolicy:
+    """Capped exponential backoff with full jitter, bounded by an optional overall budget."""
+
+    def __init__(self, base: float, budget: Optional[float] = None, cap: float = MAX_BACKOFF_SECONDS) -> None:
+        self.base = base
+        self.cap = cap
+        self.deadline = None if budget is None else time.monotonic() + budget
+
+    def compute_delay(self, attempt: int, exc: Optional[Exception] = None) -> float:
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None:
+            return retry_after
+        return min(self.cap, self.base * (2 ** attempt)) * random.random()
+
+    def allows(self, delay: float) -> bool:
+        """Whether sleeping `delay` seconds still lands before the deadline."""
+        return self.deadline is None or time.monotonic() + delay < self.deadline
+
+
+def _parse_retry_after(status: int, value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a `Retry-After` header (delta-seconds or HTTP-date) on 429/503 responses.
+
+    The header is server-controlled, so only non-negative integer seconds are accepted
+    and the hint is clamped to `MAX_BACKOFF_SECONDS`.
+    """
+    if status not in (429, 503) or value is None:
+        return None
+    value = value.strip()
+    if value.isascii() and value.isdigit():
+        return min(float(value), MAX_BACKOFF_SECONDS)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return min(max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0), MAX_BACKOFF_SECONDS)
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, DatagenHttpError) and exc.status is not None:
+        return exc.status in _RETRYABLE_STATUSES
+    return True
+
+
+def _unwrap_result(payload: Dict[str, Any]) -> Any:
+    """Validate the `{success, data: {success, result}}` envelope and return `result`."""
+    if not payload.get("success", False):
+        raise DatagenHttpError(f"Unexpected response: {payload}")
+
+    tool_payload = payload.get("data", {})
+    if not tool_payload.get("success", False):
+        raise DatagenToolError(tool_payload.get("error") or "Tool reported failure")
+
+    return tool_payload.get("result")
+
+
+def _unwrap_batch_results(payload: Any, expected: int) -> List[Any]:
+    """Validate a `{success, data: [{call_id, success, result}, ...]}` batch envelope and return the results."""
+    if not isinstance(payload, dict):
+        raise DatagenHttpError(f"Unexpected batch response: {payload}")
+    if not payload.get("success", False):
+        raise DatagenHttpError(f"Unexpected response: {payload}")
+
+    items = payload.get("data")
+    if not isinstance(items, list) or len(items) != expected:
+        raise DatagenHttpError(f"Unexpected batch response: {payload}")
+
+    results = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or item.get("call_id") != index:
+            raise DatagenHttpError(f"Unexpected batch response item {index}: {item}")
+        if not item.get("success", False):
+            raise DatagenToolError(f"Call {index}: {item.get('error') or 'Tool reported failure'}")
+        results.append(item.get("result"))
+    return results
@@ -0,0 +1,45 @@
+"""JSON encode/decode helpers.
+
+Request bodies always go through one compact stdlib encoder, so what is sent does not
+depend on whether `orjson` is installed. Responses are decoded with `orjson` when it is
+available; anything it rejects is handed to the stdlib decoder so both paths accept the
+same documents.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+# Built once so each call skips the per-call encoder/decoder setup in json.dumps/json.loads.
+# allow_nan=False keeps NaN/Infinity out of request bodies, as requests' json= encoding did.
+_encoder = json.JSONEncoder(separators=(",", ":"), allow_nan=False)
+_decoder = json.JSONDecoder()
+
+
+def dumps(obj: Any) -> bytes:
+    return _encoder.encode(obj).encode("utf-8")
+
+
+def _stdlib_loads(data: Union[bytes, str]) -> Any:
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return _decoder.decode(data)
+
+
+if orjson is not None:
+
+    def loads(data: Union[bytes, str]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Let the stdlib decoder make the final call (e.g. `NaN` literals), so invalid
+            # input fails with the same error with or without orjson.
+            return _stdlib_loads(data)
+
+else:  # pragma: no cover - exercised only without orjson
+    loads = _stdlib_loads
@@ -0,0 +1,139 @@
+import asyncio
+import os
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+from . import _json
+from ._exceptions import DatagenAuthError, DatagenError, DatagenHttpError
+from ._http import _BackoffPolicy, _is_retryable, _parse_retry_after, _unwrap_result
+
+
+class AsyncDatagenClient:
+    """asyncio counterpart of `DatagenClient`, built on `aiohttp`.
+
+    Independent tool calls can be awaited concurrently (e.g. with `asyncio.gather`)
+    over one pooled session. Requires the `async` extra: `pip install datagen-python-sdk[async]`.
+
+    The pooled session belongs to the event loop it was opened on. To reuse one client
+    across several `asyncio.run` calls, open it with `async with` inside each run so the
+    pool is closed before its loop goes away.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "https://api.datagen.dev",
+        timeout: int = 30,
+        retries: int = 0,
+        backoff_seconds: float = 0.5,
+        retry_budget_seconds: Optional[float] = None,
+    ) -> None:
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncDatagenClient requires aiohttp. Install with `pip install datagen-python-sdk[async]`."
+            )
+        self.api_key = api_key or os.getenv("DATAGEN_API_KEY")
+        if not self.api_key:
+            raise DatagenAuthError("API key missing. Set DATAGEN_API_KEY or pass api_key.")
+        self.base_url = base_url.rstrip("/")
+        self._execute_url = self.base_url + "/api/tools/execute"
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.retry_budget_seconds = retry_budget_seconds
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _check_loop(self) -> None:
+        if self._session is not None and self._session_loop is not asyncio.get_running_loop():
+            raise DatagenError(
+                "AsyncDatagenClient is bound to the event loop it was opened on; "
+                "close it (e.g. with `async with`) before using it on another loop."
+            )
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # Created lazily on the running loop; a closed session is rebuilt on the next call.
+        self._check_loop()
+        if self._session is None or self._session.closed:
+            self._session_loop = asyncio.get_running_loop()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, keepalive_timeout=60),
+                headers={
+                    "X-API-Key": self.api_key,
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
+                read_bufsize=4 * 1024 * 1024,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Release pooled connections held by the client."""
+        if self._session is not None:
+            self._check_loop()
+            await self._session.close()
+            self._session = None
+            self._session_loop = None
+
+    async def __aenter__(self) -> "AsyncDatagenClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def execute_tool(self, tool_alias_name: str, parameters: Optional[Dict[str, Any]] = None) -> Any:
+        if not tool_alias_name:
+            raise ValueError("tool_alias_name is required")
+
+        body: Dict[str, Any] = {"tool_alias_name": tool_alias_name}
+        if parameters:
+            body["parameters"] = parameters
+        data = _json.dumps(body)
+        session = self._get_session()
+        backoff = _BackoffPolicy(self.backoff_seconds, self.retry_budget_seconds)
+
+        last_exc: Optional[Exception] = None
+        for attempt in range(self.retries + 1):
+            try:
+                async with session.post(self._execute_url, data=data) as resp:
+                    if resp.status == 401 or resp.status == 403:
+                        raise DatagenAuthError(f"Auth failed: {await resp.text()}")
+                    if resp.status >= 400:
+                        raise DatagenHttpError(
+                            f"HTTP {resp.status}: {await resp.text()}",
+                            status=resp.status,
+                            retry_after=_parse_retry_after(resp.status, resp.headers.get("Retry-After")),
+                        )
+
+                    content = await resp.read()
+                try:
+                    payload = _json.loads(content)
+                except ValueError as exc:
+                    raise DatagenHttpError(f"Invalid JSON response: {content.decode('utf-8', 'replace')}") from exc
+                return _unwrap_result(payload)
+            except (aiohttp.ClientError, asyncio.TimeoutError, DatagenHttpError) as exc:
+                last_exc = exc
+                if attempt < self.retries and _is_retryable(exc):
+                    delay = backoff.compute_delay(attempt, exc)
+                    if backoff.allows(delay):
+                        await asyncio.sleep(delay)
+                        continue
+                raise
+        if last_exc:
+            raise last_exc
+        raise DatagenError("Unknown error during tool execution")
+
+    async def execute_tools_parallel(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Any]:
+        """Run independent `(tool_alias_name, parameters)` calls concurrently; results keep call order."""
+        return list(await asyncio.gather(*(self.execute_tool(name, parameters) for name, parameters in calls)))
@@ -1,24 +1,22 @@
 import os
 import time
-from typing import Any, Dict, Optional
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 import requests
+from requests.adapters import HTTPAdapter
 
-
-class DatagenError(Exception):
-    """Base Datagen SDK exception."""
-
-
-class DatagenAuthError(DatagenError):
-    """Authentication or API-key related errors."""
-
-
-class DatagenToolError(DatagenError):
-    """Returned when a tool executes but signals failure."""
-
-
-class DatagenHttpError(DatagenError):
-    """HTTP-level errors (network/4xx/5xx)."""
+from . import _json
+# Exceptions and MAX_BACKOFF_SECONDS stay importable from `datagen_sdk.client`.
+from ._exceptions import DatagenAuthError, DatagenError, DatagenHttpError, DatagenToolError
+from ._http import (
+    MAX_BACKOFF_SECONDS,
+    _BackoffPolicy,
+    _is_retryable,
+    _parse_retry_after,
+    _unwrap_batch_results,
+    _unwrap_result,
+)
 
 
 class DatagenClient:
@@ -29,52 +27,108 @@ class DatagenClient:
         timeout: int = 30,
         retries: int = 0,
         backoff_seconds: float = 0.5,
+        retry_budget_seconds: Optional[float] = None,
     ) -> None:
         self.api_key = api_key or os.getenv("DATAGEN_API_KEY")
         if not self.api_key:
             raise DatagenAuthError("API key missing. Set DATAGEN_API_KEY or pass api_key.")
         self.base_url = base_url.rstrip("/")
+        self._execute_url = self.base_url + "/api/tools/execute"
+        self._execute_batch_url = self.base_url + "/api/tools/execute_batch"
         self.timeout = timeout
         self.retries = retries
         self.backoff_seconds = backoff_seconds
+        self.retry_budget_seconds = retry_budget_seconds
+
+        # One pooled session per client so repeated calls reuse keep-alive connections.
+        # urllib3-level retries stay off; execute_tool's own retry loop is authoritative.
+        # Accept-Encoding keeps the requests default, which only lists codecs urllib3 can decode.
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "X-API-Key": self.api_key,
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            }
+        )
+        self._session.mount(self.base_url, HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=0))
+
+    def close(self) -> None:
+        """Release pooled connections held by the client."""
+        self._session.close()
+
+    def __enter__(self) -> "DatagenClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
 
     def execute_tool(self, tool_alias_name: str, parameters: Optional[Dict[str, Any]] = None) -> Any:
         if not tool_alias_name:
             raise ValueError("tool_alias_name is required")
 
-        body = {
-            "tool_alias_name": tool_alias_name,
-            "parameters": parameters or {},
-        }
-        url = f"{self.base_url}/api/tools/execute"
-        headers = {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json",
-        }
+        body: Dict[str, Any] = {"tool_alias_name": tool_alias_name}
+        if parameters:
+            body["parameters"] = parameters
+        return self._post(self._execute_url, body, _unwrap_result)
+
+    def execute_tools_batch(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Any]:
+        """Execute independent `(tool_alias_name, parameters)` calls in a single request.
+
+        Results are returned in call order. If any call fails, `DatagenToolError` is
+        raised naming the index of the first failing call.
+        """
+        if not calls:
+            return []
+
+        entries: List[Dict[str, Any]] = []
+        for call_id, (tool_alias_name, parameters) in enumerate(calls):
+            if not tool_alias_name:
+                raise ValueError("tool_alias_name is required")
+            entry: Dict[str, Any] = {"call_id": call_id, "tool_alias_name": tool_alias_name}
+            if parameters:
+                entry["parameters"] = parameters
+            entries.append(entry)
+        return self._post(
+            self._execute_batch_url,
+            {"calls": entries},
+            lambda payload: _unwrap_batch_results(payload, len(entries)),
+        )
+
+    def _post(self, url: str, body: Dict[str, Any], unwrap: Callable[[Any], Any]) -> Any:
+        data = _json.dumps(body)
+        backoff = _BackoffPolicy(self.backoff_seconds, self.retry_budget_seconds)
 
         last_exc: Optional[Exception] = None
         for attempt in range(self.retries + 1):
             try:
-                resp = requests.post(url, json=body, headers=headers, timeout=self.timeout)
+                resp = self._session.post(url, data=data, timeout=self.timeout)
                 if resp.status_code == 401 or resp.status_code == 403:
                     raise DatagenAuthError(f"Auth failed: {resp.text}")
                 if resp.status_code >= 400:
-                    raise DatagenHttpError(f"HTTP {resp.status_code}: {resp.text}")
-
-                payload = resp.json()
-                if not payload.get("success", False):
-                    raise DatagenHttpError(f"Unexpected response: {payload}")
-
-                tool_payload = payload.get("data", {})
-                if not tool_payload.get("success", False):
-                    raise DatagenToolError(tool_payload.get("error") or "Tool reported failure")
-
-                return tool_payload.get("result")
+                    raise DatagenHttpError(
+                        f"HTTP {resp.status_code}: {resp.text}",
+                        status=resp.status_code,
+                        retry_after=_parse_retry_after(resp.status_code, resp.headers.get("Retry-After")),
+                    )
+
+                try:
+                    payload = _json.loads(resp.content)
+                except ValueError as exc:
+                    raise DatagenHttpError(f"Invalid JSON response: {resp.text}") from exc
+                return unwrap(payload)
             except (requests.RequestException, DatagenHttpError) as exc:
                 last_exc = exc
-                if attempt < self.retries:
-                    time.sleep(self.backoff_seconds * (2 ** attempt))
-                    continue
+                if attempt < self.retries and _is_retryable(exc):
+                    delay = backoff.compute_delay(attempt, exc)
+                    if backoff.allows(delay):
+                        time.sleep(delay)
+                        continue
                 raise
         if last_exc:
             raise last_exc
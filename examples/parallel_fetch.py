@@ -0,0 +1,18 @@
+import asyncio
+
+from datagen_sdk import AsyncDatagenClient
+
+
+async def main() -> None:
+    async with AsyncDatagenClient(base_url="http://localhost:3001") as client:
+        # Independent calls run concurrently, so the wait is the slowest call rather than the sum.
+        projects, issues = await asyncio.gather(
+            client.execute_tool("mcp_Linear_list_projects", {"limit": 20}),
+            client.execute_tool("mcp_Linear_list_issues", {"limit": 10}),
+        )
+
+    print(f"Projects returned: {len(projects[0]['content']) if projects else 0}")
+    print(f"Issues returned: {len(issues[0]) if issues else 0}")
+
+
+asyncio.run(main())
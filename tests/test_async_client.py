@@ -0,0 +1,277 @@
+import asyncio
+import contextlib
+import gc
+import socket
+import time
+import warnings
+
+import pytest
+
+pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from datagen_sdk import (
+    AsyncDatagenClient,
+    DatagenAuthError,
+    DatagenError,
+    DatagenHttpError,
+    DatagenToolError,
+)
+from datagen_sdk import async_client as async_client_module
+from datagen_sdk._http import MAX_BACKOFF_SECONDS
+
+
+def _ok(result):
+    return {"success": True, "data": {"success": True, "result": result}}
+
+
+class _RecordingAsyncio:
+    """Stands in for `asyncio` inside the client module, recording retry sleeps instead of waiting."""
+
+    def __init__(self, delays):
+        self._delays = delays
+
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
+
+    async def sleep(self, delay):
+        self._delays.append(delay)
+
+
+@contextlib.asynccontextmanager
+async def _tool_server(*replies, delay=0.0, port=None):
+    """Serve queued `(status, body[, headers])` replies on /api/tools/execute; the last reply repeats."""
+    queue = list(replies)
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if delay:
+            await asyncio.sleep(delay)
+        status, body, *rest = queue.pop(0) if len(queue) > 1 else queue[0]
+        headers = rest[0] if rest else None
+        if isinstance(body, str):
+            return web.Response(status=status, text=body, headers=headers)
+        return web.json_response(body, status=status, headers=headers)
+
+    app = web.Application()
+    app.router.add_post("/api/tools/execute", handler)
+    async with TestServer(app, port=port) as server:
+        yield str(server.make_url("")).rstrip("/"), calls
+
+
+class TestAsyncDatagenClient:
+    """Tests for AsyncDatagenClient initialization and lifecycle."""
+
+    def test_init_with_api_key(self):
+        """Test client initialization with API key provided."""
+        client = AsyncDatagenClient(api_key="test_key")
+        assert client.api_key == "test_key"
+        assert client.base_url == "https://api.datagen.dev"
+        assert client.timeout == 30
+        assert client.retries == 0
+
+    def test_init_without_api_key(self, monkeypatch):
+        """Test client initialization fails without API key."""
+        monkeypatch.delenv("DATAGEN_API_KEY", raising=False)
+        with pytest.raises(DatagenAuthError, match="API key missing"):
+            AsyncDatagenClient()
+
+    def test_context_manager_closes_session(self):
+        """Test that the pooled session is created lazily and closed on exit."""
+
+        async def run():
+            async with AsyncDatagenClient(api_key="test_key") as client:
+                session = client._get_session()
+                assert session.headers["X-API-Key"] == "test_key"
+                assert session.headers["Content-Type"] == "application/json"
+            return session
+
+        session = asyncio.run(run())
+        assert session.closed
+
+    def test_client_reused_across_event_loops(self):
+        """Test that one client, opened per `asyncio.run` call, leaves no unclosed connectors."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        client = AsyncDatagenClient(api_key="test_key", base_url=f"http://127.0.0.1:{port}")
+
+        async def run(result):
+            async with _tool_server((200, _ok(result)), port=port):
+                async with client:
+                    return await client.execute_tool("test_tool")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert asyncio.run(run("first")) == "first"
+            assert asyncio.run(run("second")) == "second"
+            gc.collect()
+        assert client._session is None
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+    def test_open_client_rejects_another_event_loop(self):
+        """Test that a session still open on one loop is not silently used from another."""
+        client = AsyncDatagenClient(api_key="test_key")
+
+        async def open_session():
+            client._get_session()
+
+        async def use_elsewhere():
+            with pytest.raises(DatagenError, match="bound to the event loop"):
+                await client.execute_tool("test_tool")
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(open_session())
+            asyncio.run(use_elsewhere())
+            loop.run_until_complete(client.close())
+        finally:
+            loop.close()
+        assert client._session is None
+
+
+class TestAsyncExecuteTool:
+    """Tests for the async execute_tool method."""
+
+    def test_execute_tool_success(self):
+        """Test successful tool execution."""
+
+        async def run():
+            async with _tool_server((200, _ok([{"id": 1}]))) as (base_url, calls):
+                async with AsyncDatagenClient(api_key="test_key", base_url=base_url) as client:
+                    result = await client.execute_tool("test_tool", {"param": "value"})
+                return result, calls
+
+        result, calls = asyncio.run(run())
+        assert result == [{"id": 1}]
+        assert len(calls) == 1
+        assert calls[0].headers["X-API-Key"] == "test_key"
+        assert calls[0].headers["Content-Type"] == "application/json"
+        assert calls[0].headers["Accept"] == "application/json"
+        assert "gzip" in calls[0].headers["Accept-Encoding"]
+
+    def test_execute_tool_gather(self):
+        """Test that concurrent calls share one client."""
+
+        async def run():
+            async with _tool_server((200, _ok("a")), (200, _ok("b"))) as (base_url, calls):
+                async with AsyncDatagenClient(api_key="test_key", base_url=base_url) as client:
+                    results = await asyncio.gather(
+                        client.execute_tool("tool_a"),
+                        client.execute_tool("tool_b"),
+                    )
+                return results, calls
+
+        results, calls = asyncio.run(run())
+        assert sorted(results) == ["a", "b"]
+        assert len(calls) == 2
+
+    def test_execute_tool_auth_error(self):
+        """Test authentication error with 401 status."""
+
+        async def run():
+            async with _tool_server((401, "Unauthorized")) as (base_url, _):
+                async with AsyncDatagenClient(api_key="test_key", base_url=base_url) as client:
+                    await client.execute_tool("test_tool")
+
+        with pytest.raises(DatagenAuthError, match="Auth failed"):
+            asyncio.run(run())
+
+    def test_execute_tool_tool_failure(self):
+        """Test handling of tool execution failure."""
+
+        async def run():
+            failure = {"success": True, "data": {"success": False, "error": "boom"}}
+            async with _tool_server((200, failure)) as (base_url, _):
+                async with AsyncDatagenClient(api_key="test_key", base_url=base_url) as client:
+                    await client.execute_tool("test_tool")
+
+        with pytest.raises(DatagenToolError, match="boom"):
+            asyncio.run(run())
+
+    def test_execute_tool_with_retries(self):
+        """Test retry logic recovers after server errors."""
+
+        async def run():
+            replies = [(500, "Server Error"), (500, "Server Error"), (200, _ok({"status": "ok"}))]
+            async with _tool_server(*replies) as (base_url, calls):
+                async with AsyncDatagenClient(
+                    api_key="test_key", base_url=base_url, retries=2, backoff_seconds=0.01
+                ) as client:
+                    result = await client.execute_tool("test_tool")
+                return result, calls
+
+        result, calls = asyncio.run(run())
+        assert result == {"status": "ok"}
+        assert len(calls) == 3
+
+    def test_execute_tool_retries_exhausted(self):
+        """Test that exception is raised when retries are exhausted."""
+
+        async def run():
+            async with _tool_server((500, "Server Error")) as (base_url, _):
+                async with AsyncDatagenClient(
+                    api_key="test_key", base_url=base_url, retries=1, backoff_seconds=0.01
+                ) as client:
+                    await client.execute_tool("test_tool")
+
+        with pytest.raises(DatagenHttpError, match="HTTP 500"):
+            asyncio.run(run())
+
+    def test_execute_tool_client_error_not_retried(self):
+        """Test that non-transient 4xx responses fail without retrying."""
+
+        async def run():
+            async with _tool_server((400, "Bad Request")) as (base_url, calls):
+                async with AsyncDatagenClient(
+                    api_key="test_key", base_url=base_url, retries=2, backoff_seconds=0.01
+                ) as client:
+                    with pytest.raises(DatagenHttpError, match="HTTP 400"):
+                        await client.execute_tool("test_tool")
+                return calls
+
+        assert len(asyncio.run(run())) == 1
+
+    def test_execute_tools_parallel(self):
+        """Test that parallel calls overlap instead of paying each latency in turn."""
+
+        async def run():
+            async with _tool_server((200, _ok("ok")), delay=0.2) as (base_url, calls):
+                async with AsyncDatagenClient(api_key="test_key", base_url=base_url) as client:
+                    started = time.perf_counter()
+                    results = await client.execute_tools_parallel([("test_tool", {"n": i}) for i in range(10)])
+                    elapsed = time.perf_counter() - started
+                return results, calls, elapsed
+
+        results, calls, elapsed = asyncio.run(run())
+        assert results == ["ok"] * 10
+        assert len(calls) == 10
+        assert elapsed < 10 * 0.2 / 2
+
+    @pytest.mark.parametrize(
+        "retry_after, expected_delay",
+        [
+            ("nan", 0.01),
+            ("inf", 0.01),
+            ("1e9", 0.01),
+            ("999999999", MAX_BACKOFF_SECONDS),
+        ],
+    )
+    def test_execute_tool_rejects_unsafe_retry_after(self, monkeypatch, retry_after, expected_delay):
+        """Test that non-integer Retry-After values fall back to backoff and huge ones are clamped."""
+        delays = []
+        monkeypatch.setattr(async_client_module, "asyncio", _RecordingAsyncio(delays))
+        monkeypatch.setattr("datagen_sdk._http.random.random", lambda: 1.0)
+
+        async def run():
+            replies = [(429, "Too Many Requests", {"Retry-After": retry_after}), (200, _ok({"status": "ok"}))]
+            async with _tool_server(*replies) as (base_url, _):
+                async with AsyncDatagenClient(
+                    api_key="test_key", base_url=base_url, retries=1, backoff_seconds=0.01
+                ) as client:
+                    return await asyncio.wait_for(client.execute_tool("test_tool"), timeout=5)
+
+        assert asyncio.run(run()) == {"status": "ok"}
+        assert delays == [expected_delay]
@@ -1,4 +1,9 @@
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
 import pytest
+import requests
 import responses
 from datagen_sdk import (
     DatagenClient,
@@ -7,6 +12,29 @@ from datagen_sdk import (
     DatagenHttpError,
     DatagenToolError,
 )
+from datagen_sdk._http import MAX_BACKOFF_SECONDS, _BackoffPolicy
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Shared client for tests that only need the default configuration."""
+    with DatagenClient(api_key="test_key") as shared:
+        yield shared
+
+
+@pytest.fixture(scope="module")
+def _requests_mock():
+    """One `RequestsMock`, patched in once for the whole module."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+
+@pytest.fixture
+def mocked(request, _requests_mock):
+    """Expose the module's `RequestsMock` as `self.rsps`, clearing its registry and calls after each test."""
+    request.instance.rsps = _requests_mock
+    yield _requests_mock
+    _requests_mock.reset()
 
 
 class TestDatagenClient:
@@ -20,6 +48,7 @@ class TestDatagenClient:
         assert client.timeout == 30
         assert client.retries == 0
         assert client.backoff_seconds == 0.5
+        assert client.retry_budget_seconds is None
 
     def test_init_with_env_variable(self, monkeypatch):
         """Test client initialization with API key from environment."""
@@ -27,6 +56,17 @@ class TestDatagenClient:
         client = DatagenClient()
         assert client.api_key == "env_test_key"
 
+    def test_env_key_resolved_at_construction(self, monkeypatch):
+        """Test that each client resolves the env key at construction and keeps it."""
+        monkeypatch.setenv("DATAGEN_API_KEY", "first_key")
+        first = DatagenClient()
+        monkeypatch.setenv("DATAGEN_API_KEY", "second_key")
+        second = DatagenClient()
+
+        assert first.api_key == "first_key"
+        assert first._session.headers["X-API-Key"] == "first_key"
+        assert second.api_key == "second_key"
+
     def test_init_without_api_key(self, monkeypatch):
         """Test client initialization fails without API key."""
         monkeypatch.delenv("DATAGEN_API_KEY", raising=False)
@@ -55,14 +95,27 @@ class TestDatagenClient:
         )
         assert client.base_url == "https://api.datagen.dev"
 
+    def test_execute_url_precomputed(self):
+        """Test that endpoint URLs are built once from the normalized base_url."""
+        client = DatagenClient(api_key="test_key", base_url="http://localhost:3001/")
+        assert client._execute_url == "http://localhost:3001/api/tools/execute"
+        assert client._execute_batch_url == "http://localhost:3001/api/tools/execute_batch"
+
+    def test_context_manager_closes_session(self, monkeypatch):
+        """Test that leaving the context manager closes the pooled session."""
+        closed = []
+        with DatagenClient(api_key="test_key") as client:
+            monkeypatch.setattr(client._session, "close", lambda: closed.append(True))
+        assert closed == [True]
+
 
+@pytest.mark.usefixtures("mocked")
 class TestExecuteTool:
     """Tests for the execute_tool method."""
 
-    @responses.activate
-    def test_execute_tool_success(self):
+    def test_execute_tool_success(self, client):
         """Test successful tool execution."""
-        responses.add(
+        self.rsps.add(
             responses.POST,
             "https://api.datagen.dev/api/tools/execute",
             json={
@@ -75,95 +128,190 @@ class TestExecuteTool:
             status=200,
         )
 
-        client = DatagenClient(api_key="test_key")
         result = client.execute_tool("test_tool", {"param": "value"})
 
         assert result == [{"id": 1, "name": "Test Project"}]
-        assert len(responses.calls) == 1
-        assert responses.calls[0].request.headers["X-API-Key"] == "test_key"
-        assert responses.calls[0].request.headers["Content-Type"] == "application/json"
+        assert len(self.rsps.calls) == 1
+        assert json.loads(self.rsps.calls[0].request.body) == {
+            "tool_alias_name": "test_tool",
+            "parameters": {"param": "value"},
+        }
+        assert self.rsps.calls[0].request.headers["X-API-Key"] == "test_key"
+        assert self.rsps.calls[0].request.headers["Content-Type"] == "application/json"
+
+    def test_sends_accept_encoding(self, client):
+        """Test that requests ask for JSON and advertise compressed responses."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            json={"success": True, "data": {"success": True, "result": {"status": "ok"}}},
+            status=200,
+        )
+
+        client.execute_tool("test_tool")
+
+        headers = self.rsps.calls[0].request.headers
+        assert "gzip" in headers["Accept-Encoding"]
+        assert headers["Accept"] == "application/json"
+
+    def test_uses_compact_json(self, client):
+        """Test that the request body is encoded without insignificant whitespace."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            json={"success": True, "data": {"success": True, "result": {"status": "ok"}}},
+            status=200,
+        )
+
+        client.execute_tool("test_tool", {"param": "value", "nested": {"a": [1, 2]}})
+
+        body = self.rsps.calls[0].request.body
+        assert isinstance(body, bytes)
+        assert b" " not in body
+        assert json.loads(body)["parameters"] == {"param": "value", "nested": {"a": [1, 2]}}
 
-    @responses.activate
-    def test_execute_tool_with_empty_parameters(self):
+    def test_rejects_non_finite_floats(self, client):
+        """Test that NaN/Infinity parameters are refused rather than sent as invalid JSON."""
+        for value in (float("nan"), float("inf"), float("-inf")):
+            with pytest.raises(ValueError, match="Out of range float values"):
+                client.execute_tool("test_tool", {"score": value})
+
+        assert len(self.rsps.calls) == 0
+
+    def test_request_encoding_independent_of_orjson(self, client):
+        """Test that request bodies follow the stdlib json contract whether or not orjson is installed."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            json={"success": True, "data": {"success": True, "result": {"status": "ok"}}},
+            status=200,
+        )
+
+        client.execute_tool("test_tool", {"big": 2 ** 70})
+        assert json.loads(self.rsps.calls[0].request.body)["parameters"] == {"big": 2 ** 70}
+
+        with pytest.raises(TypeError):
+            client.execute_tool("test_tool", {"when": datetime.now(timezone.utc)})
+
+    def test_response_decoding_falls_back_to_stdlib(self, client):
+        """Test that documents orjson rejects are still decoded the way the stdlib decodes them."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            body='{"success": true, "data": {"success": true, "result": [NaN]}}',
+            status=200,
+        )
+
+        result = client.execute_tool("test_tool")
+        assert len(result) == 1 and result[0] != result[0]
+
+    def test_execute_tool_with_empty_parameters(self, client):
         """Test tool execution with no parameters."""
-        responses.add(
+        self.rsps.add(
             responses.POST,
             "https://api.datagen.dev/api/tools/execute",
             json={"success": True, "data": {"success": True, "result": {"status": "ok"}}},
             status=200,
         )
 
-        client = DatagenClient(api_key="test_key")
         result = client.execute_tool("test_tool")
 
         assert result == {"status": "ok"}
+        assert json.loads(self.rsps.calls[0].request.body) == {"tool_alias_name": "test_tool"}
+
+    def test_session_is_reused(self, client, monkeypatch):
+        """Test that repeated calls go through one pooled Session with urllib3 retries disabled."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            json={"success": True, "data": {"success": True, "result": {"status": "ok"}}},
+            status=200,
+        )
+        sessions = []
+        original_post = requests.Session.post
+
+        def counting_post(session, *args, **kwargs):
+            sessions.append(session)
+            return original_post(session, *args, **kwargs)
+
+        monkeypatch.setattr(requests.Session, "post", counting_post)
+
+        for _ in range(10):
+            client.execute_tool("test_tool")
+
+        assert len(sessions) == 10
+        assert all(session is client._session for session in sessions)
+        adapter = client._session.get_adapter("https://api.datagen.dev/api/tools/execute")
+        assert adapter.max_retries.total == 0
 
-    def test_execute_tool_empty_name(self):
+    def test_execute_tool_empty_name(self, client):
         """Test that empty tool name raises ValueError."""
-        client = DatagenClient(api_key="test_key")
         with pytest.raises(ValueError, match="tool_alias_name is required"):
             client.execute_tool("")
 
-    @responses.activate
-    def test_execute_tool_auth_error_401(self):
+    def test_execute_tool_auth_error_401(self, client):
         """Test authentication error with 401 status."""
-        responses.add(
+        self.rsps.add(
             responses.POST,
             "https://api.datagen.dev/api/tools/execute",
             body="Unauthorized",
             status=401,
         )
 
-        client = DatagenClient(api_key="test_key")
         with pytest.raises(DatagenAuthError, match="Auth failed"):
             client.execute_tool("test_tool")
 
-    @responses.activate
-    def test_execute_tool_auth_error_403(self):
+    def test_execute_tool_auth_error_403(self, client):
         """Test authentication error with 403 status."""
-        responses.add(
+        self.rsps.add(
             responses.POST,
             "https://api.datagen.dev/api/tools/execute",
             body="Forbidden",
             status=403,
         )
 
-        client = DatagenClient(api_key="test_key")
         with pytest.raises(DatagenAuthError, match="Auth failed"):
             client.execute_tool("test_tool")
 
-    @responses.activate
-    def test_execute_tool_http_error(self):
+    def test_execute_tool_http_error(self, client):
         """Test HTTP error handling."""
-        responses.add(
+        self.rsps.add(
             responses.POST,
             "https://api.datagen.dev/api/tools/execute",
             body="Internal Server Error",
             status=500,
         )
 
-        client = DatagenClient(api_key="test_key")
         with pytest.raises(DatagenHttpError, match="HTTP 500"):
             client.execute_tool("test_tool")
 
-    @responses.activate
-    def test_execute_tool_unsuccessful_response(self):
+    def test_execute_tool_unsuccessful_response(self, client):
         """Test handling of unsuccessful API response."""
-        responses.add(
+        self.rsps.add(
             responses.POST,
             "https://api.datagen.dev/api/tools/execute",
             json={"success": False, "error": "Something went wrong"},
             status=200,
         )
 
-        client = DatagenClient(api_key="test_key")
         with pytest.raises(DatagenHttpError, match="Unexpected response"):
             client.execute_tool("test_tool")
 
-    @responses.activate
-    def test_execute_tool_tool_failure(self):
+    def test_execute_tool_invalid_json(self, client):
+        """Test that a non-JSON body surfaces as DatagenHttpError."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            body="<html>gateway</html>",
+            status=200,
+        )
+
+        with pytest.raises(DatagenHttpError, match="Invalid JSON response"):
+            client.execute_tool("test_tool")
+
+    def test_execute_tool_tool_failure(self, client):
         """Test handling of tool execution failure."""
-        responses.add(
+        self.rsps.add(
             responses.POST,
             "https://api.datagen.dev/api/tools/execute",
             json={
@@ -176,27 +324,25 @@ class TestExecuteTool:
             status=200,
         )
 
-        client = DatagenClient(api_key="test_key")
         with pytest.raises(DatagenToolError, match="Tool execution failed"):
             client.execute_tool("test_tool")
 
-    @responses.activate
     def test_execute_tool_with_retries(self):
         """Test retry logic with exponential backoff."""
         # First two calls fail, third succeeds
-        responses.add(
+        self.rsps.add(
             responses.POST,
             "https://api.datagen.dev/api/tools/execute",
             body="Server Error",
             status=500,
         )
-        responses.add(
+        self.rsps.add(
             responses.POST,
             "https://api.datagen.dev/api/tools/execute",
             body="Server Error",
             status=500,
         )
-        responses.add(
+        self.rsps.add(
             responses.POST,
             "https://api.datagen.dev/api/tools/execute",
             json={
@@ -210,14 +356,13 @@ class TestExecuteTool:
         result = client.execute_tool("test_tool")
 
         assert result == {"status": "ok"}
-        assert len(responses.calls) == 3
+        assert len(self.rsps.calls) == 3
 
-    @responses.activate
     def test_execute_tool_retries_exhausted(self):
         """Test that exception is raised when retries are exhausted."""
         # All calls fail
         for _ in range(4):
-            responses.add(
+            self.rsps.add(
                 responses.POST,
                 "https://api.datagen.dev/api/tools/execute",
                 body="Server Error",
@@ -228,7 +373,352 @@ class TestExecuteTool:
         with pytest.raises(DatagenHttpError, match="HTTP 500"):
             client.execute_tool("test_tool")
 
-        assert len(responses.calls) == 4  # Initial + 3 retries
+        assert len(self.rsps.calls) == 4  # Initial + 3 retries
+
+    def test_execute_tool_backoff_jittered_and_capped(self, monkeypatch):
+        """Test that retry delays are drawn from [0, min(backoff * 2**attempt, cap)]."""
+        for _ in range(4):
+            self.rsps.add(
+                responses.POST,
+                "https://api.datagen.dev/api/tools/execute",
+                body="Server Error",
+                status=500,
+            )
+        delays = []
+        monkeypatch.setattr("datagen_sdk.client.time.sleep", delays.append)
+        monkeypatch.setattr("datagen_sdk._http.random.random", lambda: 1.0)
+
+        client = DatagenClient(api_key="test_key", retries=3, backoff_seconds=10.0)
+        with pytest.raises(DatagenHttpError):
+            client.execute_tool("test_tool")
+
+        assert delays == [10.0, 20.0, MAX_BACKOFF_SECONDS]
+
+    def test_backoff_respects_deadline(self, monkeypatch):
+        """Test that retries stop once the next sleep would overrun the retry budget."""
+        for _ in range(6):
+            self.rsps.add(
+                responses.POST,
+                "https://api.datagen.dev/api/tools/execute",
+                body="Server Error",
+                status=500,
+            )
+        clock = [0.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        monkeypatch.setattr("datagen_sdk.client.time.monotonic", lambda: clock[0])
+        monkeypatch.setattr("datagen_sdk.client.time.sleep", fake_sleep)
+        monkeypatch.setattr("datagen_sdk._http.random.random", lambda: 1.0)
+
+        client = DatagenClient(api_key="test_key", retries=5, backoff_seconds=0.4, retry_budget_seconds=1.0)
+        with pytest.raises(DatagenHttpError, match="HTTP 500"):
+            client.execute_tool("test_tool")
+
+        # 0.4s sleep fits the 1s budget; the following 0.8s sleep would not.
+        assert len(self.rsps.calls) == 2
+        assert clock[0] == pytest.approx(0.4)
+
+    def test_backoff_has_jitter(self):
+        """Test that backoff delays vary and stay within the exponential bound."""
+        policy = _BackoffPolicy(base=1.0)
+        delays = {policy.compute_delay(3) for _ in range(50)}
+        assert len(delays) > 1
+        assert all(0 <= delay <= 8.0 for delay in delays)
+
+    def test_execute_tool_client_error_not_retried(self):
+        """Test that non-transient 4xx responses fail without retrying."""
+        for _ in range(3):
+            self.rsps.add(
+                responses.POST,
+                "https://api.datagen.dev/api/tools/execute",
+                body="Bad Request",
+                status=400,
+            )
+
+        client = DatagenClient(api_key="test_key", retries=2, backoff_seconds=0.01)
+        with pytest.raises(DatagenHttpError, match="HTTP 400") as exc_info:
+            client.execute_tool("test_tool")
+
+        assert exc_info.value.status == 400
+        assert len(self.rsps.calls) == 1
+
+    def test_execute_tool_transient_4xx_retried(self):
+        """Test that 408/425/429 are treated as transient and retried."""
+        for status in (408, 425, 429):
+            self.rsps.add(
+                responses.POST,
+                "https://api.datagen.dev/api/tools/execute",
+                body="Try again",
+                status=status,
+            )
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            json={"success": True, "data": {"success": True, "result": {"status": "ok"}}},
+            status=200,
+        )
+
+        client = DatagenClient(api_key="test_key", retries=3, backoff_seconds=0.01)
+        assert client.execute_tool("test_tool") == {"status": "ok"}
+        assert len(self.rsps.calls) == 4
+
+    def test_execute_tool_auth_error_not_retried(self):
+        """Test that auth failures are terminal even when retries are enabled."""
+        for _ in range(3):
+            self.rsps.add(
+                responses.POST,
+                "https://api.datagen.dev/api/tools/execute",
+                body="Unauthorized",
+                status=401,
+            )
+
+        client = DatagenClient(api_key="test_key", retries=2, backoff_seconds=0.01)
+        with pytest.raises(DatagenAuthError, match="Auth failed"):
+            client.execute_tool("test_tool")
+
+        assert len(self.rsps.calls) == 1
+
+    def test_execute_tool_honors_retry_after(self, monkeypatch):
+        """Test that Retry-After on a 429 replaces the exponential delay."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            body="Too Many Requests",
+            status=429,
+            headers={"Retry-After": "2"},
+        )
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            json={"success": True, "data": {"success": True, "result": {"status": "ok"}}},
+            status=200,
+        )
+        delays = []
+        monkeypatch.setattr("datagen_sdk.client.time.sleep", delays.append)
+
+        client = DatagenClient(api_key="test_key", retries=1, backoff_seconds=0.01)
+        assert client.execute_tool("test_tool") == {"status": "ok"}
+        assert delays == [2.0]
+
+    @pytest.mark.parametrize(
+        "retry_after, expected_delay",
+        [
+            ("nan", 0.01),
+            ("inf", 0.01),
+            ("1e9", 0.01),
+            ("-5", 0.01),
+            ("999999999", MAX_BACKOFF_SECONDS),
+        ],
+    )
+    def test_execute_tool_rejects_unsafe_retry_after(self, monkeypatch, retry_after, expected_delay):
+        """Test that non-integer Retry-After values fall back to backoff and huge ones are clamped."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            body="Too Many Requests",
+            status=429,
+            headers={"Retry-After": retry_after},
+        )
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            json={"success": True, "data": {"success": True, "result": {"status": "ok"}}},
+            status=200,
+        )
+        delays = []
+        monkeypatch.setattr("datagen_sdk.client.time.sleep", delays.append)
+        monkeypatch.setattr("datagen_sdk._http.random.random", lambda: 1.0)
+
+        client = DatagenClient(api_key="test_key", retries=1, backoff_seconds=0.01)
+        assert client.execute_tool("test_tool") == {"status": "ok"}
+        assert delays == [expected_delay]
+
+    def test_execute_tool_honors_retry_after_zero(self, monkeypatch):
+        """Test that Retry-After: 0 on a 429 retries immediately."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            body="Too Many Requests",
+            status=429,
+            headers={"Retry-After": "0"},
+        )
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            json={"success": True, "data": {"success": True, "result": {"status": "ok"}}},
+            status=200,
+        )
+        delays = []
+        monkeypatch.setattr("datagen_sdk.client.time.sleep", delays.append)
+
+        client = DatagenClient(api_key="test_key", retries=1, backoff_seconds=5.0)
+        assert client.execute_tool("test_tool") == {"status": "ok"}
+        assert len(self.rsps.calls) == 2
+        assert delays == [0.0]
+
+    def test_execute_tool_honors_retry_after_http_date_on_503(self, monkeypatch):
+        """Test that an HTTP-date Retry-After on a 503 is converted to a delay."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            body="Service Unavailable",
+            status=503,
+            headers={"Retry-After": format_datetime(retry_at, usegmt=True)},
+        )
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            json={"success": True, "data": {"success": True, "result": {"status": "ok"}}},
+            status=200,
+        )
+        delays = []
+        monkeypatch.setattr("datagen_sdk.client.time.sleep", delays.append)
+
+        client = DatagenClient(api_key="test_key", retries=1, backoff_seconds=0.01)
+        assert client.execute_tool("test_tool") == {"status": "ok"}
+        assert len(delays) == 1
+        assert 28 <= delays[0] <= 30
+
+        # A date months ahead is clamped like an oversized delta-seconds value.
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            body="Service Unavailable",
+            status=503,
+            headers={"Retry-After": format_datetime(retry_at + timedelta(days=90), usegmt=True)},
+        )
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute",
+            json={"success": True, "data": {"success": True, "result": {"status": "ok"}}},
+            status=200,
+        )
+        delays.clear()
+        assert client.execute_tool("test_tool") == {"status": "ok"}
+        assert delays == [MAX_BACKOFF_SECONDS]
+
+
+@pytest.mark.usefixtures("mocked")
+class TestExecuteToolBatch:
+    """Tests for the execute_tools_batch method."""
+
+    def test_execute_tools_batch_single_request(self, client):
+        """Test that a batch of calls is sent as one POST and results come back in order."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute_batch",
+            json={
+                "success": True,
+                "data": [{"call_id": i, "success": True, "result": {"n": i}} for i in range(5)],
+            },
+            status=200,
+        )
+
+        calls = [("test_tool", {"n": i}) for i in range(4)] + [("other_tool", None)]
+        results = client.execute_tools_batch(calls)
+
+        assert results == [{"n": i} for i in range(5)]
+        assert len(self.rsps.calls) == 1
+        assert self.rsps.calls[0].request.headers["X-API-Key"] == "test_key"
+        body = json.loads(self.rsps.calls[0].request.body)
+        assert body["calls"][0] == {"call_id": 0, "tool_alias_name": "test_tool", "parameters": {"n": 0}}
+        assert body["calls"][4] == {"call_id": 4, "tool_alias_name": "other_tool"}
+
+    def test_execute_tools_batch_empty(self, client):
+        """Test that an empty batch returns without a request."""
+        assert client.execute_tools_batch([]) == []
+
+    def test_execute_tools_batch_empty_name(self, client):
+        """Test that an empty tool name in a batch raises ValueError."""
+        with pytest.raises(ValueError, match="tool_alias_name is required"):
+            client.execute_tools_batch([("test_tool", None), ("", None)])
+
+    def test_execute_tools_batch_tool_failure(self, client):
+        """Test that a failing call raises DatagenToolError naming its index."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute_batch",
+            json={
+                "success": True,
+                "data": [
+                    {"call_id": 0, "success": True, "result": "ok"},
+                    {"call_id": 1, "success": False, "error": "Tool execution failed"},
+                ],
+            },
+            status=200,
+        )
+
+        with pytest.raises(DatagenToolError, match="Call 1: Tool execution failed"):
+            client.execute_tools_batch([("test_tool", None), ("test_tool", None)])
+
+    def test_execute_tools_batch_result_count_mismatch(self, client):
+        """Test that a batch response with the wrong number of results is rejected."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute_batch",
+            json={"success": True, "data": [{"call_id": 0, "success": True, "result": "ok"}]},
+            status=200,
+        )
+
+        with pytest.raises(DatagenHttpError, match="Unexpected batch response"):
+            client.execute_tools_batch([("test_tool", None), ("test_tool", None)])
+
+    def test_execute_tools_batch_top_level_list(self, client):
+        """Test that a bare array instead of the batch envelope is rejected with DatagenHttpError."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute_batch",
+            json=[{"call_id": 0, "success": True, "result": 1}],
+            status=200,
+        )
+
+        with pytest.raises(DatagenHttpError, match="Unexpected batch response"):
+            client.execute_tools_batch([("test_tool", None)])
+
+    def test_execute_tools_batch_malformed_item(self, client):
+        """Test that non-object batch items are rejected with DatagenHttpError."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute_batch",
+            json={"success": True, "data": [None]},
+            status=200,
+        )
+
+        with pytest.raises(DatagenHttpError, match="Unexpected batch response item 0"):
+            client.execute_tools_batch([("test_tool", None)])
+
+    def test_execute_tools_batch_call_id_mismatch(self, client):
+        """Test that results are matched to calls by call_id."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute_batch",
+            json={
+                "success": True,
+                "data": [
+                    {"call_id": 1, "success": True, "result": "b"},
+                    {"call_id": 0, "success": True, "result": "a"},
+                ],
+            },
+            status=200,
+        )
+
+        with pytest.raises(DatagenHttpError, match="Unexpected batch response item 0"):
+            client.execute_tools_batch([("tool_a", None), ("tool_b", None)])
+
+    def test_execute_tools_batch_auth_error(self, client):
+        """Test authentication error on the batch endpoint."""
+        self.rsps.add(
+            responses.POST,
+            "https://api.datagen.dev/api/tools/execute_batch",
+            body="Unauthorized",
+            status=401,
+        )
+
+        with pytest.raises(DatagenAuthError, match="Auth failed"):
+            client.execute_tools_batch([("test_tool", None)])
 
 
 class TestExceptions:
@@ -250,3 +740,10 @@ class TestExceptions:
 
         tool_error = DatagenToolError("Tool failed")
         assert str(tool_error) == "Tool failed"
+
+    def test_http_error_carries_status(self):
+        """Test that DatagenHttpError exposes the HTTP status and Retry-After hint."""
+        http_error = DatagenHttpError("HTTP 429", status=429, retry_after=1.5)
+        assert http_error.status == 429
+        assert http_error.retry_after == 1.5
+        assert DatagenHttpError("boom").status is None